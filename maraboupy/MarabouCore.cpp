@@ -15,6 +15,7 @@
  **/
 
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 #include <map>
 #include <vector>
@@ -141,6 +142,14 @@ void addSignConstraint(InputQuery& ipq, unsigned var1, unsigned var2){
     ipq.addPiecewiseLinearConstraint(r);
 }
 
+void popLastPiecewiseLinearConstraint(InputQuery& ipq){
+    List<PiecewiseLinearConstraint *> &constraints = ipq.getPiecewiseLinearConstraints();
+    if ( constraints.empty() )
+        return;
+    delete constraints.back();
+    constraints.popBack();
+}
+
 void addMaxConstraint(InputQuery& ipq, std::set<unsigned> elements, unsigned v){
     Set<unsigned> e;
     for(unsigned var: elements)
@@ -167,6 +176,110 @@ void addAbsConstraint(InputQuery& ipq, unsigned b, unsigned f){
     ipq.addPiecewiseLinearConstraint(new AbsoluteValueConstraint(b, f));
 }
 
+typedef py::array_t<int, py::array::c_style | py::array::forcecast> IntArray;
+typedef py::array_t<double, py::array::c_style | py::array::forcecast> DoubleArray;
+
+void setLowerBoundsBulk(InputQuery& ipq, IntArray vars, DoubleArray values){
+    auto v = vars.unchecked<1>();
+    auto val = values.unchecked<1>();
+    for ( py::ssize_t i = 0; i < v.shape( 0 ); ++i )
+        ipq.setLowerBound( v( i ), val( i ) );
+}
+
+void setUpperBoundsBulk(InputQuery& ipq, IntArray vars, DoubleArray values){
+    auto v = vars.unchecked<1>();
+    auto val = values.unchecked<1>();
+    for ( py::ssize_t i = 0; i < v.shape( 0 ); ++i )
+        ipq.setUpperBound( v( i ), val( i ) );
+}
+
+void setBoundsBulk(InputQuery& ipq, IntArray vars, DoubleArray lowerBounds,
+                   DoubleArray upperBounds){
+    auto v = vars.unchecked<1>();
+    auto lo = lowerBounds.unchecked<1>();
+    auto hi = upperBounds.unchecked<1>();
+    for ( py::ssize_t i = 0; i < v.shape( 0 ); ++i )
+    {
+        ipq.setLowerBound( v( i ), lo( i ) );
+        ipq.setUpperBound( v( i ), hi( i ) );
+    }
+}
+
+void markInputVariablesBulk(InputQuery& ipq, IntArray vars){
+    auto v = vars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < v.shape( 0 ); ++i )
+        ipq.markInputVariable( v( i ), i );
+}
+
+void markOutputVariablesBulk(InputQuery& ipq, IntArray vars){
+    auto v = vars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < v.shape( 0 ); ++i )
+        ipq.markOutputVariable( v( i ), i );
+}
+
+void addEquationsBulk(InputQuery& ipq, IntArray types, IntArray rowPtr,
+                      IntArray vars, DoubleArray coeffs, DoubleArray scalars){
+    auto typesBuf = types.unchecked<1>();
+    auto rowPtrBuf = rowPtr.unchecked<1>();
+    auto varsBuf = vars.unchecked<1>();
+    auto coeffsBuf = coeffs.unchecked<1>();
+    auto scalarsBuf = scalars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < typesBuf.shape( 0 ); ++i )
+    {
+        Equation eq( static_cast<Equation::EquationType>( typesBuf( i ) ) );
+        for ( int j = rowPtrBuf( i ); j < rowPtrBuf( i + 1 ); ++j )
+            eq.addAddend( coeffsBuf( j ), varsBuf( j ) );
+        eq.setScalar( scalarsBuf( i ) );
+        ipq.addEquation( eq );
+    }
+}
+
+void addReluConstraintsBulk(InputQuery& ipq, IntArray bVars, IntArray fVars){
+    auto b = bVars.unchecked<1>();
+    auto f = fVars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < b.shape( 0 ); ++i )
+        ipq.addPiecewiseLinearConstraint( new ReluConstraint( b( i ), f( i ) ) );
+}
+
+void addLeakyReluConstraintsBulk(InputQuery& ipq, IntArray bVars, IntArray fVars,
+                                 DoubleArray slopes){
+    auto b = bVars.unchecked<1>();
+    auto f = fVars.unchecked<1>();
+    auto s = slopes.unchecked<1>();
+    for ( py::ssize_t i = 0; i < b.shape( 0 ); ++i )
+        ipq.addPiecewiseLinearConstraint( new LeakyReluConstraint( b( i ), f( i ), s( i ) ) );
+}
+
+void addBilinearConstraintsBulk(InputQuery& ipq, IntArray bVars1, IntArray bVars2,
+                                IntArray fVars){
+    auto b1 = bVars1.unchecked<1>();
+    auto b2 = bVars2.unchecked<1>();
+    auto f = fVars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < b1.shape( 0 ); ++i )
+        ipq.addNonlinearConstraint( new BilinearConstraint( b1( i ), b2( i ), f( i ) ) );
+}
+
+void addSigmoidConstraintsBulk(InputQuery& ipq, IntArray bVars, IntArray fVars){
+    auto b = bVars.unchecked<1>();
+    auto f = fVars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < b.shape( 0 ); ++i )
+        ipq.addNonlinearConstraint( new SigmoidConstraint( b( i ), f( i ) ) );
+}
+
+void addSignConstraintsBulk(InputQuery& ipq, IntArray bVars, IntArray fVars){
+    auto b = bVars.unchecked<1>();
+    auto f = fVars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < b.shape( 0 ); ++i )
+        ipq.addPiecewiseLinearConstraint( new SignConstraint( b( i ), f( i ) ) );
+}
+
+void addAbsConstraintsBulk(InputQuery& ipq, IntArray bVars, IntArray fVars){
+    auto b = bVars.unchecked<1>();
+    auto f = fVars.unchecked<1>();
+    for ( py::ssize_t i = 0; i < b.shape( 0 ); ++i )
+        ipq.addPiecewiseLinearConstraint( new AbsoluteValueConstraint( b( i ), f( i ) ) );
+}
+
 void loadProperty(InputQuery &inputQuery, std::string propertyFilePath)
 {
     String propertyFilePathM = String(propertyFilePath);
@@ -683,6 +796,16 @@ PYBIND11_MODULE(MarabouCore, m) {
             var2 (int): Output variable to Sign constraint
         )pbdoc",
           py::arg("inputQuery"), py::arg("var1"), py::arg("var2"));
+    m.def("popLastPiecewiseLinearConstraint", &popLastPiecewiseLinearConstraint, R"pbdoc(
+        Remove the most recently added piecewise linear constraint from the InputQuery
+
+        Together with the constraint adders this allows pushing a constraint,
+        solving, and backtracking without rebuilding the whole query.
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to pop from
+        )pbdoc",
+        py::arg("inputQuery"));
     m.def("addMaxConstraint", &addMaxConstraint, R"pbdoc(
         Add a Max constraint to the InputQuery
 
@@ -709,6 +832,127 @@ PYBIND11_MODULE(MarabouCore, m) {
             f (int): Output variable
         )pbdoc",
         py::arg("inputQuery"), py::arg("b"), py::arg("f"));
+    m.def("setLowerBoundsBulk", &setLowerBoundsBulk, R"pbdoc(
+        Set lower bounds for a batch of variables in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            vars (np.ndarray of int32): Variables to bound
+            values (np.ndarray of float64): Lower bound of each variable
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("vars"), py::arg("values"));
+    m.def("setUpperBoundsBulk", &setUpperBoundsBulk, R"pbdoc(
+        Set upper bounds for a batch of variables in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            vars (np.ndarray of int32): Variables to bound
+            values (np.ndarray of float64): Upper bound of each variable
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("vars"), py::arg("values"));
+    m.def("setBoundsBulk", &setBoundsBulk, R"pbdoc(
+        Set lower and upper bounds for a batch of variables in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            vars (np.ndarray of int32): Variables to bound
+            lowerBounds (np.ndarray of float64): Lower bound of each variable
+            upperBounds (np.ndarray of float64): Upper bound of each variable
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("vars"), py::arg("lowerBounds"), py::arg("upperBounds"));
+    m.def("markInputVariablesBulk", &markInputVariablesBulk, R"pbdoc(
+        Mark a batch of variables as input variables in one call
+
+        Variable vars[i] is marked as input variable number i.
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            vars (np.ndarray of int32): Variables to mark as inputs, in input order
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("vars"));
+    m.def("markOutputVariablesBulk", &markOutputVariablesBulk, R"pbdoc(
+        Mark a batch of variables as output variables in one call
+
+        Variable vars[i] is marked as output variable number i.
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            vars (np.ndarray of int32): Variables to mark as outputs, in output order
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("vars"));
+    m.def("addEquationsBulk", &addEquationsBulk, R"pbdoc(
+        Add a batch of equations to the InputQuery in one call
+
+        The equations are described in CSR form: addend j of equation i is
+        coeffs[rowPtr[i] + j] * vars[rowPtr[i] + j], and rowPtr has one more
+        entry than there are equations.
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            types (np.ndarray of int32): Equation type (EQ/GE/LE) of each equation
+            rowPtr (np.ndarray of int32): Offsets into vars/coeffs of each equation's addends
+            vars (np.ndarray of int32): Variable numbers of all addends, concatenated
+            coeffs (np.ndarray of float64): Coefficients of all addends, concatenated
+            scalars (np.ndarray of float64): Scalar term of each equation
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("types"), py::arg("rowPtr"), py::arg("vars"),
+        py::arg("coeffs"), py::arg("scalars"));
+    m.def("addReluConstraintsBulk", &addReluConstraintsBulk, R"pbdoc(
+        Add a batch of Relu constraints to the InputQuery in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            bVars (np.ndarray of int32): Input variables of the Relu constraints
+            fVars (np.ndarray of int32): Output variables of the Relu constraints
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("bVars"), py::arg("fVars"));
+    m.def("addLeakyReluConstraintsBulk", &addLeakyReluConstraintsBulk, R"pbdoc(
+        Add a batch of LeakyRelu constraints to the InputQuery in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            bVars (np.ndarray of int32): Input variables of the Leaky ReLU constraints
+            fVars (np.ndarray of int32): Output variables of the Leaky ReLU constraints
+            slopes (np.ndarray of float64): Slopes of the Leaky ReLU constraints
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("bVars"), py::arg("fVars"), py::arg("slopes"));
+    m.def("addBilinearConstraintsBulk", &addBilinearConstraintsBulk, R"pbdoc(
+        Add a batch of Bilinear constraints to the InputQuery in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            bVars1 (np.ndarray of int32): First input variables of the Bilinear constraints
+            bVars2 (np.ndarray of int32): Second input variables of the Bilinear constraints
+            fVars (np.ndarray of int32): Output variables of the Bilinear constraints
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("bVars1"), py::arg("bVars2"), py::arg("fVars"));
+    m.def("addSigmoidConstraintsBulk", &addSigmoidConstraintsBulk, R"pbdoc(
+        Add a batch of Sigmoid constraints to the InputQuery in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            bVars (np.ndarray of int32): Input variables of the Sigmoid constraints
+            fVars (np.ndarray of int32): Output variables of the Sigmoid constraints
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("bVars"), py::arg("fVars"));
+    m.def("addSignConstraintsBulk", &addSignConstraintsBulk, R"pbdoc(
+        Add a batch of Sign constraints to the InputQuery in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            bVars (np.ndarray of int32): Input variables of the Sign constraints
+            fVars (np.ndarray of int32): Output variables of the Sign constraints
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("bVars"), py::arg("fVars"));
+    m.def("addAbsConstraintsBulk", &addAbsConstraintsBulk, R"pbdoc(
+        Add a batch of Abs constraints to the InputQuery in one call
+
+        Args:
+            inputQuery (:class:`~maraboupy.MarabouCore.InputQuery`): Marabou input query to be solved
+            bVars (np.ndarray of int32): Input variables of the Abs constraints
+            fVars (np.ndarray of int32): Output variables of the Abs constraints
+        )pbdoc",
+        py::arg("inputQuery"), py::arg("bVars"), py::arg("fVars"));
     m.def("addDisjunctionConstraint", &addDisjunctionConstraint, R"pbdoc(
         Add a disjunction constraint to the InputQuery
 
@@ -19,7 +19,51 @@ MarabouNetwork defines an abstract class that represents neural networks with pi
 from maraboupy import MarabouCore
 from maraboupy import MarabouUtils
 from maraboupy.MarabouPythonic import *
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import os
+import sys
+import tempfile
+
+# Shared default options object, created lazily on first use. Constructing
+# MarabouCore.Options snapshots the solver's built-in defaults, so one
+# instance can be reused by every call that does not pass its own options.
+_defaultOptions = None
+
+def _getDefaultOptions():
+    """Function to return the shared default MarabouCore.Options object
+
+    :meta private:
+    """
+    global _defaultOptions
+    if _defaultOptions is None:
+        _defaultOptions = MarabouCore.Options()
+    return _defaultOptions
+
+def _localRobustnessWorker(queryFilename, optionValues, elements, outputVar):
+    """Function solving one target-class robustness query in a worker process
+
+    Args:
+        queryFilename (str): File holding the serialized base query
+        optionValues (Dict[str, object]): Attribute values to apply to a fresh Options object
+        elements (set of int): Input variables of the max constraint to push
+        outputVar (int): Output variable of the max constraint to push
+
+    Returns:
+        (tuple): tuple containing:
+            - exitCode (str): A string representing the exit code
+            - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise SATisfying values
+            - timedOut (bool): Whether the solve timed out
+
+    :meta private:
+    """
+    options = MarabouCore.Options()
+    for name, value in optionValues.items():
+        setattr(options, name, value)
+    ipq = MarabouCore.loadQuery(queryFilename)
+    MarabouCore.addMaxConstraint(ipq, elements, outputVar)
+    exitCode, vals, stats = MarabouCore.solve(ipq, options, "")
+    return exitCode, vals, stats.hasTimedOut()
 
 
 class MarabouNetwork:
@@ -39,6 +83,17 @@ class MarabouNetwork:
         inputVars (list of numpy arrays): Input variables
         outputVars (list of numpy arrays): Output variables
     """
+    # Attribute access on these fields happens in the hot query-build loops;
+    # __slots__ turns each lookup into a fixed-offset load and drops the
+    # per-instance __dict__. Subclasses that do not declare __slots__
+    # themselves keep a __dict__ for their own attributes.
+    __slots__ = ('numVars', 'equList', 'additionalEquList', 'reluList',
+                 'leakyReluList', 'sigmoidList', 'maxList', 'softmaxList',
+                 'bilinearList', 'absList', 'signList', 'disjunctionList',
+                 '_convertedDisjunctionList', 'lowerBounds', 'upperBounds',
+                 '_inputVars', '_outputVars', '_flatInputVars', '_flatOutputVars',
+                 '_compiledBuilder', '_compiledSnapshot')
+
     def __init__(self):
         """Constructs a MarabouNetwork object and calls function to initialize
         """
@@ -59,10 +114,33 @@ class MarabouNetwork:
         self.absList = []
         self.signList = []
         self.disjunctionList = []
+        self._convertedDisjunctionList = []
         self.lowerBounds = dict()
         self.upperBounds = dict()
         self.inputVars = []
         self.outputVars = []
+        self._compiledBuilder = None
+        self._compiledSnapshot = None
+
+    @property
+    def inputVars(self):
+        """list of numpy arrays: Input variables"""
+        return self._inputVars
+
+    @inputVars.setter
+    def inputVars(self, value):
+        self._inputVars = value
+        self._flatInputVars = None
+
+    @property
+    def outputVars(self):
+        """list of numpy arrays: Output variables"""
+        return self._outputVars
+
+    @outputVars.setter
+    def outputVars(self, value):
+        self._outputVars = value
+        self._flatOutputVars = None
 
     def clearProperty(self):
         """Clear the lower bounds and upper bounds map, and the self.additionEquList
@@ -93,6 +171,7 @@ class MarabouNetwork:
             self.additionalEquList += [x]
         else:
             self.equList += [x]
+            self._invalidateCompiledQuery()
 
     def setLowerBound(self, x, v):
         """Function to set lower bound for variable
@@ -120,6 +199,7 @@ class MarabouNetwork:
             v2 (int): Variable representing output of Relu
         """
         self.reluList += [(v1, v2)]
+        self._invalidateCompiledQuery()
 
     def addLeakyRelu(self, v1, v2, slope):
         """Function to add a new Leaky Relu constraint
@@ -130,6 +210,7 @@ class MarabouNetwork:
             slope (float): Shope of the Leaky ReLU
         """
         self.leakyReluList += [(v1, v2, slope)]
+        self._invalidateCompiledQuery()
 
     def addBilinear(self, v1, v2, v3):
         """Function to add a bilinear constraint to the network
@@ -139,6 +220,7 @@ class MarabouNetwork:
             v3 (int): Variable representing output of Bilinear
         """
         self.bilinearList += [(v1, v2, v3)]
+        self._invalidateCompiledQuery()
 
     def addSigmoid(self, v1, v2):
         """Function to add a new Sigmoid constraint
@@ -148,6 +230,7 @@ class MarabouNetwork:
             v2 (int): Variable representing output of Sigmoid
         """
         self.sigmoidList += [(v1, v2)]
+        self._invalidateCompiledQuery()
 
     def addMaxConstraint(self, elements, v):
         """Function to add a new Max constraint
@@ -157,6 +240,7 @@ class MarabouNetwork:
             v (int): Variable representing output of max constraint
         """
         self.maxList += [(elements, v)]
+        self._invalidateCompiledQuery()
 
     def addSoftmaxConstraint(self, inputs, outputs):
         """Function to add a new softmax constraint
@@ -166,6 +250,7 @@ class MarabouNetwork:
             outputs (set of int): Variables representing outputs of max constraint
         """
         self.softmaxList += [(inputs, outputs)]
+        self._invalidateCompiledQuery()
 
     def addAbsConstraint(self, b, f):
         """Function to add a new Abs constraint
@@ -175,6 +260,7 @@ class MarabouNetwork:
             f (int): Variable representing output of the Abs constraint
         """
         self.absList += [(b, f)]
+        self._invalidateCompiledQuery()
 
     def addSignConstraint(self, b, f):
         """Function to add a new Sign constraint
@@ -184,6 +270,25 @@ class MarabouNetwork:
             f (int): Variable representing output of Sign
         """
         self.signList += [(b, f)]
+        self._invalidateCompiledQuery()
+
+    def _convertEquation(self, e):
+        """Function to convert a MarabouUtils.Equation into a MarabouCore.Equation
+
+        Args:
+            e (:class:`~maraboupy.MarabouUtils.Equation`): Equation to convert
+
+        Returns:
+            :class:`~maraboupy.MarabouCore.Equation`
+
+        :meta private:
+        """
+        eq = MarabouCore.Equation(e.EquationType)
+        for (c, v) in e.addendList:
+            assert v < self.numVars
+            eq.addAddend(c, v)
+        eq.setScalar(e.scalar)
+        return eq
 
     def addDisjunctionConstraint(self, disjuncts):
         """Function to add a new Disjunction constraint
@@ -191,7 +296,12 @@ class MarabouNetwork:
         Args:
             disjuncts (list of list of Equations): Each inner list represents a disjunct
         """
+        # Convert the nested equations to MarabouCore form once, here, so the
+        # conversion cost is not paid again on every query build
+        converted = [[self._convertEquation(e) for e in disjunct] for disjunct in disjuncts]
         self.disjunctionList.append(disjuncts)
+        self._convertedDisjunctionList.append(converted)
+        self._invalidateCompiledQuery()
 
     def lowerBoundExists(self, x):
         """Function to check whether lower bound for a variable is known
@@ -247,100 +357,256 @@ class MarabouNetwork:
         e.setScalar(scalar)
         self.addEquation(e, isProperty)
 
+    @staticmethod
+    def _flattenVarArrays(varArrays):
+        """Function to concatenate variable arrays into one flat int32 array
+
+        :meta private:
+        """
+        if len(varArrays) == 0:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate([v.ravel() for v in varArrays]).astype(np.int32, copy=False)
+
+    def _flattenedInputVars(self):
+        """Function to concatenate all input variable arrays into one flat array
+
+        The result is memoized: assigning inputVars invalidates the cache,
+        and a total-size check catches arrays appended to the list in place.
+
+        Returns:
+            (np.ndarray of int32): All input variables, in input order
+
+        :meta private:
+        """
+        if self._flatInputVars is None \
+                or self._flatInputVars.size != sum(v.size for v in self._inputVars):
+            self._flatInputVars = self._flattenVarArrays(self._inputVars)
+        return self._flatInputVars
+
+    def _flattenedOutputVars(self):
+        """Function to concatenate all output variable arrays into one flat array
+
+        Memoized in the same way as :func:`_flattenedInputVars`.
+
+        Returns:
+            (np.ndarray of int32): All output variables, in output order
+
+        :meta private:
+        """
+        if self._flatOutputVars is None \
+                or self._flatOutputVars.size != sum(v.size for v in self._outputVars):
+            self._flatOutputVars = self._flattenVarArrays(self._outputVars)
+        return self._flatOutputVars
+
+    @staticmethod
+    def _equationsToArrays(equations):
+        """Function to flatten a list of equations into SoA-style numpy columns
+
+        Addend j of equation i lives at index rowPtr[i] + j of eqVars and
+        eqCoeffs. The buffers are preallocated and filled in a single pass, so
+        the structure-of-arrays form is built without intermediate Python
+        objects and can be handed to the bulk C++ API or compared with
+        C-level array operations.
+
+        Args:
+            equations (list of :class:`~maraboupy.MarabouUtils.Equation`): Equations to flatten
+
+        Returns:
+            (tuple): tuple containing:
+                - eqTypes (np.ndarray of int32): Equation type of each equation
+                - rowPtr (np.ndarray of int32): Offsets of each equation's addends
+                - eqVars (np.ndarray of int32): Variable numbers of all addends
+                - eqCoeffs (np.ndarray of float64): Coefficients of all addends
+                - scalars (np.ndarray of float64): Scalar term of each equation
+
+        :meta private:
+        """
+        numEquations = len(equations)
+        numAddends = sum(len(e.addendList) for e in equations)
+        eqTypes = np.empty(numEquations, dtype=np.int32)
+        rowPtr = np.empty(numEquations + 1, dtype=np.int32)
+        eqVars = np.empty(numAddends, dtype=np.int32)
+        eqCoeffs = np.empty(numAddends, dtype=np.float64)
+        scalars = np.empty(numEquations, dtype=np.float64)
+        rowPtr[0] = 0
+        offset = 0
+        for i, e in enumerate(equations):
+            eqTypes[i] = int(e.EquationType)
+            scalars[i] = e.scalar
+            for (c, v) in e.addendList:
+                eqCoeffs[offset] = c
+                eqVars[offset] = v
+                offset += 1
+            rowPtr[i + 1] = offset
+        return eqTypes, rowPtr, eqVars, eqCoeffs, scalars
+
+    def _addEquationsToQuery(self, ipq, equations):
+        """Function to hand a list of equations to an InputQuery in one bulk call
+
+        Args:
+            ipq (:class:`~maraboupy.MarabouCore.InputQuery`): InputQuery to receive the equations
+            equations (list of :class:`~maraboupy.MarabouUtils.Equation`): Equations to add
+
+        :meta private:
+        """
+        if len(equations) == 0:
+            return
+        eqTypes, rowPtr, eqVars, eqCoeffs, scalars = self._equationsToArrays(equations)
+        if __debug__:
+            assert eqVars.max(initial=-1) < self.numVars
+        MarabouCore.addEquationsBulk(ipq, eqTypes, rowPtr, eqVars, eqCoeffs, scalars)
+
+    def _structureSnapshot(self):
+        """Function to summarize the sizes of the structural parts of the network
+
+        Used to detect, cheaply, whether the compiled query builder is stale
+        because the network structure was modified without going through the
+        add methods.
+
+        Returns:
+            (tuple): Sizes of the structural attributes
+
+        :meta private:
+        """
+        return (self.numVars, len(self.inputVars), len(self.outputVars),
+                len(self.equList), len(self.reluList), len(self.leakyReluList),
+                len(self.sigmoidList), len(self.maxList), len(self.softmaxList),
+                len(self.bilinearList), len(self.absList), len(self.signList),
+                len(self.disjunctionList))
+
+    def _invalidateCompiledQuery(self):
+        """Function to discard the compiled query builder
+
+        Called whenever the network structure changes, so that the next
+        getMarabouQuery call re-specializes the builder.
+
+        :meta private:
+        """
+        self._compiledBuilder = None
+
+    def _compileQueryBuilder(self):
+        """Function to specialize a query builder for the current network structure
+
+        The network structure (equations and piecewise linear / nonlinear
+        constraints) is immutable between solves in typical property-checking
+        workflows: only the bounds and the additional equations change. This
+        prepares all structural data once - flat variable arrays, equation
+        SoA columns, converted disjunctions - validates it, and returns a
+        closure that replays it onto a fresh InputQuery, so repeated query
+        builds only pay for the bounds and property constraints.
+
+        Returns:
+            (function): Builder writing the network structure into an InputQuery
+
+        :meta private:
+        """
+        numVars = self.numVars
+        inputIds = self._flattenedInputVars()
+        outputIds = self._flattenedOutputVars()
+        eqTypes, rowPtr, eqVars, eqCoeffs, scalars = self._equationsToArrays(self.equList)
+
+        # The pairwise constraint lists become parallel int32 columns, so the
+        # C++ side can be fed one contiguous batch per constraint type
+        reluArr = np.array(self.reluList, dtype=np.int32).reshape(-1, 2)
+        reluB, reluF = np.ascontiguousarray(reluArr[:, 0]), np.ascontiguousarray(reluArr[:, 1])
+        leakyReluArr = np.array(self.leakyReluList, dtype=np.float64).reshape(-1, 3)
+        leakyReluB = leakyReluArr[:, 0].astype(np.int32)
+        leakyReluF = leakyReluArr[:, 1].astype(np.int32)
+        leakyReluSlopes = np.ascontiguousarray(leakyReluArr[:, 2])
+        bilinearArr = np.array(self.bilinearList, dtype=np.int32).reshape(-1, 3)
+        bilinearB1 = np.ascontiguousarray(bilinearArr[:, 0])
+        bilinearB2 = np.ascontiguousarray(bilinearArr[:, 1])
+        bilinearF = np.ascontiguousarray(bilinearArr[:, 2])
+        sigmoidArr = np.array(self.sigmoidList, dtype=np.int32).reshape(-1, 2)
+        sigmoidB, sigmoidF = np.ascontiguousarray(sigmoidArr[:, 0]), np.ascontiguousarray(sigmoidArr[:, 1])
+        absArr = np.array(self.absList, dtype=np.int32).reshape(-1, 2)
+        absB, absF = np.ascontiguousarray(absArr[:, 0]), np.ascontiguousarray(absArr[:, 1])
+        signArr = np.array(self.signList, dtype=np.int32).reshape(-1, 2)
+        signB, signF = np.ascontiguousarray(signArr[:, 0]), np.ascontiguousarray(signArr[:, 1])
+        maxList = list(self.maxList)
+        softmaxList = list(self.softmaxList)
+
+        # One vectorized (or C-level) reduction per constraint family replaces
+        # the per-item interpreted asserts; skipped entirely under -O
+        if __debug__:
+            assert eqVars.max(initial=-1) < numVars
+            assert reluArr.max(initial=-1) < numVars
+            assert leakyReluB.max(initial=-1) < numVars and leakyReluF.max(initial=-1) < numVars
+            assert np.all((leakyReluSlopes > 0) & (leakyReluSlopes < 1))
+            assert bilinearArr.max(initial=-1) < numVars
+            assert sigmoidArr.max(initial=-1) < numVars
+            for m in maxList:
+                assert m[1] < numVars and max(m[0]) < numVars
+            for m in softmaxList:
+                assert max(m[0]) < numVars and max(m[1]) < numVars
+
+        # Disjunctions were already converted to MarabouCore form at add time
+        convertedDisjunctions = list(self._convertedDisjunctionList)
+
+        def build(ipq):
+            ipq.setNumberOfVariables(numVars)
+            MarabouCore.markInputVariablesBulk(ipq, inputIds)
+            MarabouCore.markOutputVariablesBulk(ipq, outputIds)
+            if len(eqTypes) > 0:
+                MarabouCore.addEquationsBulk(ipq, eqTypes, rowPtr, eqVars, eqCoeffs, scalars)
+            MarabouCore.addReluConstraintsBulk(ipq, reluB, reluF)
+            MarabouCore.addLeakyReluConstraintsBulk(ipq, leakyReluB, leakyReluF, leakyReluSlopes)
+            MarabouCore.addBilinearConstraintsBulk(ipq, bilinearB1, bilinearB2, bilinearF)
+            MarabouCore.addSigmoidConstraintsBulk(ipq, sigmoidB, sigmoidF)
+            for m in maxList:
+                MarabouCore.addMaxConstraint(ipq, m[0], m[1])
+            for m in softmaxList:
+                MarabouCore.addSoftmaxConstraint(ipq, m[0], m[1])
+            MarabouCore.addAbsConstraintsBulk(ipq, absB, absF)
+            MarabouCore.addSignConstraintsBulk(ipq, signB, signF)
+            for disjunction in convertedDisjunctions:
+                MarabouCore.addDisjunctionConstraint(ipq, disjunction)
+
+        return build
+
     def getMarabouQuery(self):
         """Function to convert network into Marabou InputQuery
 
+        The conversion plan is compiled once and reused across calls while
+        the network structure is unchanged. Staleness is detected from the
+        variable count and the lengths of the constraint lists, so structural
+        edits must go through the add* methods (or change the length of one
+        of the lists) to be picked up; mutating a stored equation or
+        constraint tuple in place after a query has been built is not
+        detected and the next query would replay the old structure. Bounds
+        and equations added with isProperty=True are re-read on every call
+        and may be changed freely.
+
         Returns:
             :class:`~maraboupy.MarabouCore.InputQuery`
         """
+        snapshot = self._structureSnapshot()
+        if self._compiledBuilder is None or self._compiledSnapshot != snapshot:
+            self._compiledBuilder = self._compileQueryBuilder()
+            self._compiledSnapshot = snapshot
+
         ipq = MarabouCore.InputQuery()
-        ipq.setNumberOfVariables(self.numVars)
-
-        i = 0
-        for inputVarArray in self.inputVars:
-            for inputVar in inputVarArray.flatten():
-                ipq.markInputVariable(inputVar, i)
-                i+=1
-
-        i = 0
-        for outputVarArray in self.outputVars:
-            for outputVar in outputVarArray.flatten():
-                ipq.markOutputVariable(outputVar, i)
-                i+=1
-
-        for e in self.equList:
-            eq = MarabouCore.Equation(e.EquationType)
-            for (c, v) in e.addendList:
-                assert v < self.numVars
-                eq.addAddend(c, v)
-            eq.setScalar(e.scalar)
-            ipq.addEquation(eq)
+        self._compiledBuilder(ipq)
 
-        for e in self.additionalEquList:
-            eq = MarabouCore.Equation(e.EquationType)
-            for (c, v) in e.addendList:
-                assert v < self.numVars
-                eq.addAddend(c, v)
-            eq.setScalar(e.scalar)
-            ipq.addEquation(eq)
-
-        for r in self.reluList:
-            assert r[1] < self.numVars and r[0] < self.numVars
-            MarabouCore.addReluConstraint(ipq, r[0], r[1])
-
-        for r in self.leakyReluList:
-            assert r[1] < self.numVars and r[0] < self.numVars
-            assert(r[2] > 0 and r[2] < 1)
-            MarabouCore.addLeakyReluConstraint(ipq, r[0], r[1], r[2])
-
-        for r in self.bilinearList:
-            assert r[2] < self.numVars and r[1] < self.numVars and r[0] < self.numVars
-            MarabouCore.addBilinearConstraint(ipq, r[0], r[1], r[2])
-
-        for r in self.sigmoidList:
-            assert r[1] < self.numVars and r[0] < self.numVars
-            MarabouCore.addSigmoidConstraint(ipq, r[0], r[1])
-
-        for m in self.maxList:
-            assert m[1] < self.numVars
-            for e in m[0]:
-                assert e < self.numVars
-            MarabouCore.addMaxConstraint(ipq, m[0], m[1])
-
-        for m in self.softmaxList:
-            for e in m[1]:
-                assert e < self.numVars
-            for e in m[0]:
-                assert e < self.numVars
-            MarabouCore.addSoftmaxConstraint(ipq, m[0], m[1])
-
-        for b, f in self.absList:
-            MarabouCore.addAbsConstraint(ipq, b, f)
-
-        for b, f in self.signList:
-            MarabouCore.addSignConstraint(ipq, b, f)
-
-        for disjunction in self.disjunctionList:
-            converted_disjunction = []
-            for disjunct in disjunction:
-                converted_disjunct = []
-                for e in disjunct:
-                    eq = MarabouCore.Equation(e.EquationType)
-                    for (c, v) in e.addendList:
-                        assert v < self.numVars
-                        eq.addAddend(c, v)
-                    eq.setScalar(e.scalar)
-                    converted_disjunct.append(eq)
-                converted_disjunction.append(converted_disjunct)
-            MarabouCore.addDisjunctionConstraint(ipq, converted_disjunction)
-
-        for l in self.lowerBounds:
-            assert l < self.numVars
-            ipq.setLowerBound(l, self.lowerBounds[l])
-
-        for u in self.upperBounds:
-            assert u < self.numVars
-            ipq.setUpperBound(u, self.upperBounds[u])
+        self._addEquationsToQuery(ipq, self.additionalEquList)
+
+        if __debug__:
+            assert max(self.lowerBounds, default=-1) < self.numVars
+            assert max(self.upperBounds, default=-1) < self.numVars
+
+        # The bound dicts are flattened into parallel variable/value arrays
+        # and installed with one FFI call per dict
+        if len(self.lowerBounds) > 0:
+            numBounds = len(self.lowerBounds)
+            boundVars = np.fromiter(self.lowerBounds.keys(), dtype=np.int32, count=numBounds)
+            boundVals = np.fromiter(self.lowerBounds.values(), dtype=np.float64, count=numBounds)
+            MarabouCore.setLowerBoundsBulk(ipq, boundVars, boundVals)
+
+        if len(self.upperBounds) > 0:
+            numBounds = len(self.upperBounds)
+            boundVars = np.fromiter(self.upperBounds.keys(), dtype=np.int32, count=numBounds)
+            boundVals = np.fromiter(self.upperBounds.values(), dtype=np.float64, count=numBounds)
+            MarabouCore.setUpperBoundsBulk(ipq, boundVars, boundVals)
 
         return ipq
 
@@ -362,19 +628,21 @@ class MarabouNetwork:
         ipq = self.getMarabouQuery()
         if propertyFilename:
             MarabouCore.loadProperty(ipq, propertyFilename)
-        if options == None:
-            options = MarabouCore.Options()
+        if options is None:
+            options = _getDefaultOptions()
         exitCode, vals, stats = MarabouCore.solve(ipq, options, str(filename))
         if verbose:
             print(exitCode)
             if exitCode == "sat":
-                for j in range(len(self.inputVars)):
-                    for i in range(self.inputVars[j].size):
-                        print("input {} = {}".format(i, vals[self.inputVars[j].item(i)]))
-
-                for j in range(len(self.outputVars)):
-                    for i in range(self.outputVars[j].size):
-                        print("output {} = {}".format(i, vals[self.outputVars[j].item(i)]))
+                # Assemble the whole assignment as one string so it leaves in
+                # a single write instead of one syscall per variable
+                lines = []
+                for inVars in self.inputVars:
+                    lines.extend(f"input {i} = {vals[v]}" for i, v in enumerate(inVars.ravel().tolist()))
+                for outVars in self.outputVars:
+                    lines.extend(f"output {i} = {vals[v]}" for i, v in enumerate(outVars.ravel().tolist()))
+                if lines:
+                    sys.stdout.write("\n".join(lines) + "\n")
 
         return [exitCode, vals, stats]
 
@@ -394,20 +662,84 @@ class MarabouNetwork:
                 - stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed
         """
         ipq = self.getMarabouQuery()
-        if options == None:
-            options = MarabouCore.Options()
+        if options is None:
+            options = _getDefaultOptions()
         exitCode, bounds, stats = MarabouCore.calculateBounds(ipq, options, str(filename))
         
         if verbose:
             print(exitCode)
             if exitCode == "":
-                for j in range(len(self.outputVars)):
-                    for i in range(self.outputVars[j].size):
-                        print("output bounds {} = {}".format(i, bounds[self.outputVars[j].item(i)]))
+                lines = []
+                for outVars in self.outputVars:
+                    lines.extend(f"output bounds {i} = {bounds[v]}" for i, v in enumerate(outVars.ravel().tolist()))
+                if lines:
+                    sys.stdout.write("\n".join(lines) + "\n")
 
         return [exitCode, bounds, stats]
 
-    def evaluateLocalRobustness(self, input, epsilon, originalClass, verbose=True, options=None, targetClass=None):
+    def _evaluateLocalRobustnessParallel(self, ipq, candidateClasses, outputStartIndex, originalClass, options):
+        """Function to check the candidate classes in parallel worker processes
+
+        Each candidate class solves an independent query over the same base
+        network, so the per-class loop is task parallel. The base query is
+        serialized once; every worker loads it, pushes its class's max
+        constraint and solves. Results are consumed in candidate order so
+        that the reported outcome, including maxClass, matches the serial
+        loop. Once a satisfiable result is found, solves that have not
+        started yet are cancelled; solves that are already running cannot be
+        cancelled, and leaving the executor blocks until they finish, so the
+        early exit only saves the work that was never started.
+
+        Args:
+            ipq (:class:`~maraboupy.MarabouCore.InputQuery`): Base query including the input bounds
+            candidateClasses (list of int): Output classes to check
+            outputStartIndex (int): Variable number of the first output
+            originalClass (int): Output class of the target input
+            options (:class:`~maraboupy.MarabouCore.Options`): Object for specifying Marabou options
+
+        Returns:
+            (tuple): tuple containing:
+                - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise SATisfying values
+                - timedOut (bool): Whether any solve timed out
+                - maxClass (int): Output class which value is max within outputs if SAT
+
+        :meta private:
+        """
+        fd, queryFilename = tempfile.mkstemp(suffix=".ipq")
+        os.close(fd)
+        try:
+            MarabouCore.saveQuery(ipq, queryFilename)
+            # Options objects cannot be pickled, so ship their attribute
+            # values and rebuild the object in each worker
+            optionValues = {name: getattr(options, name) for name in dir(options)
+                            if name.startswith('_') and not name.startswith('__')}
+            vals = {}
+            timedOut = False
+            maxClass = None
+            maxWorkers = min(len(candidateClasses), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+                futures = []
+                for outputLayerIndex in candidateClasses:
+                    elements = set([int(outputStartIndex + outputLayerIndex),
+                                    int(outputStartIndex + originalClass)])
+                    future = executor.submit(_localRobustnessWorker, queryFilename, optionValues,
+                                             elements, int(outputStartIndex + outputLayerIndex))
+                    futures.append((outputLayerIndex, future))
+                for outputLayerIndex, future in futures:
+                    exitCode, futureVals, futureTimedOut = future.result()
+                    if futureTimedOut:
+                        timedOut = True
+                        break
+                    elif len(futureVals) > 0:
+                        maxClass = outputLayerIndex
+                        vals = futureVals
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+            return vals, timedOut, maxClass
+        finally:
+            os.remove(queryFilename)
+
+    def evaluateLocalRobustness(self, input, epsilon, originalClass, verbose=True, options=None, targetClass=None, parallel=False):
         """Function evaluating a specific input is a local robustness within the scope of epslion
 
         Args:
@@ -417,11 +749,12 @@ class MarabouNetwork:
             verbose (bool): If true, print out solution after solve finishes
             options (:class:`~maraboupy.MarabouCore.Options`): Object for specifying Marabou options, defaults to None
             targetClass (int): If set, find a feasible solution with which the value of targetClass is max within outputs.
+            parallel (bool): If true, check the candidate classes in parallel worker processes; stats is None in that case
 
         Returns:
             (tuple): tuple containing:
                 - vals (Dict[int, float]): Empty dictionary if UNSAT, otherwise a dictionary of SATisfying values for variables
-                - stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed
+                - stats (:class:`~maraboupy.MarabouCore.Statistics`): A Statistics object to how Marabou performed, or None if parallel
                 - maxClass (int): Output class which value is max within outputs if SAT.
         """
         inputVars = None
@@ -448,52 +781,74 @@ class MarabouNetwork:
             err_msg = "Unpexpected type of output vars."
             raise RuntimeError(err_msg)
 
-        if options == None:
-            options = MarabouCore.Options()
+        if options is None:
+            options = _getDefaultOptions()
+
+        # Compute the epsilon ball around the input with two broadcast ufunc
+        # calls; the bounds are pushed straight onto the query below instead
+        # of polluting the network's bound dicts
+        flattenInputVars = inputVars.flatten().astype(np.int32, copy=False)
+        flattenInput = np.asarray(input, dtype=np.float64).ravel()
+        inputLowerBounds = flattenInput - epsilon
+        inputUpperBounds = flattenInput + epsilon
 
-        # Add constratins to all input nodes
-        flattenInputVars = inputVars.flatten()
-        flattenInput = input.flatten()
-        for i in range(flattenInput.size):
-            self.setLowerBound(flattenInputVars[i], flattenInput[i] - epsilon)
-            self.setUpperBound(flattenInputVars[i], flattenInput[i] + epsilon)
-        
         maxClass = None
         outputStartIndex = self.outputVars[0][0][0]
 
+        # Build the query once; the per-class max constraint is pushed onto it
+        # and popped again, so the network is not re-converted for every
+        # candidate class
+        ipq = self.getMarabouQuery()
+        MarabouCore.setBoundsBulk(ipq, flattenInputVars, inputLowerBounds, inputUpperBounds)
+
+        stats = None
+        timedOut = False
+
         if targetClass is None:
             outputLayerSize = len(self.outputVars[0][0])
-            # loop for all of output classes except for original class
-            for outputLayerIndex in range(outputLayerSize):
-                if outputLayerIndex != originalClass:
-                    self.addMaxConstraint(set([outputStartIndex + outputLayerIndex, outputStartIndex + originalClass]), 
-                        outputStartIndex + outputLayerIndex)
-                    exitCode, vals, stats = self.solve(options = options)
-                    if (stats.hasTimedOut()):
-                        break
-                    elif (len(vals) > 0):
-                        maxClass = outputLayerIndex
-                        break
+            if parallel:
+                candidateClasses = [i for i in range(outputLayerSize) if i != originalClass]
+                vals, timedOut, maxClass = self._evaluateLocalRobustnessParallel(
+                    ipq, candidateClasses, outputStartIndex, originalClass, options)
+            else:
+                # loop for all of output classes except for original class
+                for outputLayerIndex in range(outputLayerSize):
+                    if outputLayerIndex != originalClass:
+                        MarabouCore.addMaxConstraint(ipq, set([outputStartIndex + outputLayerIndex, outputStartIndex + originalClass]),
+                            outputStartIndex + outputLayerIndex)
+                        exitCode, vals, stats = MarabouCore.solve(ipq, options, "")
+                        MarabouCore.popLastPiecewiseLinearConstraint(ipq)
+                        if verbose:
+                            print(exitCode)
+                        if (stats.hasTimedOut()):
+                            timedOut = True
+                            break
+                        elif (len(vals) > 0):
+                            maxClass = outputLayerIndex
+                            break
         else:
-            self.addMaxConstraint(set(self.outputVars[0][0]), outputStartIndex + targetClass)
-            exitCode, vals, stats = self.solve(options = options)
+            MarabouCore.addMaxConstraint(ipq, set(self.outputVars[0][0]), outputStartIndex + targetClass)
+            exitCode, vals, stats = MarabouCore.solve(ipq, options, "")
+            MarabouCore.popLastPiecewiseLinearConstraint(ipq)
+            timedOut = stats.hasTimedOut()
             if verbose:
-                if not stats.hasTimedOut() and len(vals) > 0:
+                print(exitCode)
+                if not timedOut and len(vals) > 0:
                     maxClass = targetClass
-        
+
         # print timeout, or feasible inputs and outputs if verbose is on.
         if verbose:
-            if stats.hasTimedOut():
+            if timedOut:
                 print("TO")
             elif len(vals) > 0:
                 print("sat")
-                for j in range(len(self.inputVars[0])):
-                    for i in range(self.inputVars[0][j].size):
-                        print("input {} = {}".format(i, vals[self.inputVars[0][j].item(i)]))
-
-                for j in range(len(self.outputVars[0])):
-                    for i in range(self.outputVars[0][j].size):
-                        print("output {} = {}".format(i, vals[self.outputVars[0][j].item(i)]))
+                lines = []
+                for inVars in self.inputVars[0]:
+                    lines.extend(f"input {i} = {vals[v]}" for i, v in enumerate(np.asarray(inVars).ravel().tolist()))
+                for outVars in self.outputVars[0]:
+                    lines.extend(f"output {i} = {vals[v]}" for i, v in enumerate(np.asarray(outVars).ravel().tolist()))
+                if lines:
+                    sys.stdout.write("\n".join(lines) + "\n")
 
         return [vals, stats, maxClass]
 
@@ -520,35 +875,36 @@ class MarabouNetwork:
         # Make sure inputValues is a list of np arrays and not list of lists
         inputValues = [np.array(inVal) for inVal in inputValues]
         
-        inputVars = self.inputVars # list of numpy arrays
         outputVars = self.outputVars # list of numpy arrays
 
-        inputDict = dict()
-        inputVarList = np.concatenate([inVar.flatten() for inVar in inputVars], axis=-1).flatten()
-        inputValList = np.concatenate([inVal.flatten() for inVal in inputValues]).flatten()
-        assignList = zip(inputVarList, inputValList)
-        for x in assignList:
-            inputDict[x[0]] = x[1]
+        # The flat input variable array is memoized on the network; only the
+        # value buffer needs to be filled per call before the single bulk
+        # bounds call
+        inputVarList = self._flattenedInputVars()
+        inputValList = np.empty(inputVarList.size, dtype=np.float64)
+        offset = 0
+        for inVal in inputValues:
+            inputValList[offset:offset + inVal.size] = inVal.ravel()
+            offset += inVal.size
 
         ipq = self.getMarabouQuery()
-        for k in inputDict:
-            ipq.setLowerBound(k, inputDict[k])
-            ipq.setUpperBound(k, inputDict[k])
+        MarabouCore.setBoundsBulk(ipq, inputVarList, inputValList, inputValList)
 
-        if options == None:
-            options = MarabouCore.Options()
+        if options is None:
+            options = _getDefaultOptions()
         exitCode, outputDict, _ = MarabouCore.solve(ipq, options, str(filename))
 
         # When the query is UNSAT an empty dictionary is returned
         if outputDict == {}:
             return None
 
-        outputValues = [outVars.reshape(-1).astype(np.float64) for outVars in outputVars]
-        for i in range(len(outputValues)):
-            for j in range(len(outputValues[i])):
-                outputValues[i][j] = outputDict[outputValues[i][j]]
-            outputValues[i] = outputValues[i].reshape(outputVars[i].shape)
-        return outputValues
+        # The solution assigns a value to every variable 0..numVars-1, so it
+        # can be densified into one float64 array and each output tensor
+        # gathered with a single fancy-indexed lookup instead of a Python
+        # dict lookup per output variable
+        solutionValues = np.fromiter(map(outputDict.__getitem__, range(len(outputDict))),
+                                     dtype=np.float64, count=len(outputDict))
+        return [solutionValues[outVars] for outVars in outputVars]
 
     def evaluate(self, inputValues, useMarabou=True, options=None, filename="evaluateWithMarabou.log"):
         """Function to evaluate network at a given point
@@ -564,8 +920,7 @@ class MarabouNetwork:
         """
         if useMarabou:
             return self.evaluateWithMarabou(inputValues, filename=filename, options=options)
-        if not useMarabou:
-            return self.evaluateWithoutMarabou(inputValues)
+        return self.evaluateWithoutMarabou(inputValues)
 
     def findError(self, inputValues, options=None, filename="evaluateWithMarabou.log"):
         """Function to find error between Marabou solver and TF/Nnet at a given point
@@ -581,7 +936,13 @@ class MarabouNetwork:
         outMar = self.evaluate(inputValues, useMarabou=True, options=options, filename=filename)
         outNotMar = self.evaluate(inputValues, useMarabou=False, options=options, filename=filename)
         assert len(outMar) == len(outNotMar)
-        err = [np.abs(outMar[i] - outNotMar[i]) for i in range(len(outMar))]
+        # Subtract and take the absolute value into one preallocated buffer
+        # per output, avoiding the temporary array a plain np.abs(a - b) makes
+        err = []
+        for marValues, notMarValues in zip(outMar, outNotMar):
+            buf = np.subtract(marValues, notMarValues)
+            np.abs(buf, out=buf)
+            err.append(buf)
         return err
 
     def isEqualTo(self, network):
@@ -591,7 +952,6 @@ class MarabouNetwork:
         :param network: the other Marabou network to be compared with.
         :return: True if these two networks and all their attributes are identical; False if not.
         """
-        equivalence = True
         if self.numVars != network.numVars \
                 or self.reluList != network.reluList \
                 or self.sigmoidList != network.sigmoidList \
@@ -601,17 +961,23 @@ class MarabouNetwork:
                 or self.disjunctionList != network.disjunctionList \
                 or self.lowerBounds != network.lowerBounds \
                 or self.upperBounds != network.upperBounds:
-            equivalence = False
+            return False
+        if len(self.equList) != len(network.equList):
+            return False
         for equation1, equation2 in zip(self.equList, network.equList):
             if not equation1.isEqualTo(equation2):
-                equivalence = False
+                return False
+        if len(self.inputVars) != len(network.inputVars):
+            return False
         for inputvars1, inputvars2 in zip(self.inputVars, network.inputVars):
-            if (inputvars1.flatten() != inputvars2.flatten()).any():
-                equivalence = False
+            if not np.array_equal(inputvars1, inputvars2):
+                return False
+        if len(self.outputVars) != len(network.outputVars):
+            return False
         for outputVars1, outputVars2 in zip(self.outputVars, network.outputVars):
-            if (outputVars1.flatten() != outputVars1.flatten()).any():
-                equivalence = False
-        return equivalence
+            if not np.array_equal(outputVars1, outputVars2):
+                return False
+        return True
 
     def addConstraint(self, constraint: VarConstraint):
         """
@@ -575,11 +575,15 @@ def test_local_robustness_unsat():
     options = Marabou.createOptions(verbosity = 0)
 
     input = np.array([1, 0])
+    maxListBefore = list(network.maxList)
     vals, stats, maxClass = network.evaluateLocalRobustness(input=input, epsilon=0.1, originalClass=0, options=options, targetClass=None)
 
     # should be local robustness
     assert(len(vals) == 0)
 
+    # the per-class max constraints must not leak into the network
+    assert(network.maxList == maxListBefore)
+
 def test_local_robustness_sat():
     """
     Tests local robustness of an nnet network. (SAT)
@@ -590,11 +594,15 @@ def test_local_robustness_sat():
     options = Marabou.createOptions(verbosity = 0)
 
     input = np.array([1, -2])
+    maxListBefore = list(network.maxList)
     vals, stats, maxClass = network.evaluateLocalRobustness(input=input, epsilon=0.1, originalClass=0, options=options, targetClass=None)
 
     # should be not local robustness
     assert(len(vals) > 0)
 
+    # the per-class max constraints must not leak into the network
+    assert(network.maxList == maxListBefore)
+
 def  test_local_robustness_unsat_of_onnx():
     """
     Tests local robustness of an onnx network. (UNSAT)
@@ -636,6 +644,7 @@ def test_local_robustness_sat_with_target_class():
 
     input = np.array([1, -2])
     targetClass = 1
+    maxListBefore = list(network.maxList)
     vals, stats, maxClass = network.evaluateLocalRobustness(input=input, epsilon=0.1, originalClass=0, options=options, targetClass=targetClass)
 
     # should be not local robustness
@@ -644,6 +653,9 @@ def test_local_robustness_sat_with_target_class():
     # maxClass should be equal to targetClass
     assert(maxClass == targetClass)
 
+    # the target-class max constraint must not leak into the network
+    assert(network.maxList == maxListBefore)
+
 def test_local_robustness_sat_of_onnx_3D():
     """
     Tests local robustness of an onnx network which input's dimension is 3. (SAT)
@@ -698,9 +710,32 @@ def test_calculate_bounds():
     # calculate bounds
     exitCode, vals, _ = network.calculateBounds(options = options)
 
-    # exitCode should be unsat 
+    # exitCode should be unsat
     assert(exitCode == 'unsat')
 
+def test_is_equal_to_variable_differences():
+    """
+    Tests that isEqualTo reports networks differing only in their variables as unequal.
+    Regression test for a bug where the output variables of a network were compared
+    against themselves, so any two networks with equal constraints compared equal.
+    """
+    filename =  "fc_2-2-3.nnet"
+
+    network1 = loadNetwork(filename)
+    network2 = loadNetwork(filename)
+
+    # identical networks should compare equal
+    assert(network1.isEqualTo(network2))
+
+    # differing only in output variables
+    network2.outputVars = [outputVars + 1 for outputVars in network2.outputVars]
+    assert(not network1.isEqualTo(network2))
+
+    # differing only in the number of input variable arrays
+    network3 = loadNetwork(filename)
+    network3.inputVars = network3.inputVars + [np.array([0])]
+    assert(not network1.isEqualTo(network3))
+
 def loadNetwork(filename):
     # Load network relative to this file's location
     filename = os.path.join(os.path.dirname(__file__), NETWORK_FOLDER, filename)
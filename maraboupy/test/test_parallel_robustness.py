@@ -0,0 +1,53 @@
+# Supress warnings caused by tensorflow
+import warnings
+warnings.filterwarnings('ignore', category = DeprecationWarning)
+warnings.filterwarnings('ignore', category = PendingDeprecationWarning)
+
+from maraboupy import Marabou
+import numpy as np
+import os
+
+# Global settings
+NNET_FILE = "../../resources/nnet/fc_2-2-3.nnet" # simple fully-connected test network
+OPT = Marabou.createOptions(verbosity = 0)       # Turn off printing
+
+def test_parallel_robustness_unsat():
+    """
+    Test that the parallel local robustness check agrees with the serial one
+    on an input the network is robust around. (UNSAT)
+    """
+    input = np.array([1, 0])
+    valsSerial, _, maxClassSerial = evaluateRobustness(input, parallel=False)
+    valsParallel, _, maxClassParallel = evaluateRobustness(input, parallel=True)
+
+    # both modes should prove robustness
+    assert(len(valsSerial) == 0)
+    assert(len(valsParallel) == 0)
+
+    # and report the same (absent) adversarial class
+    assert(maxClassSerial == maxClassParallel)
+
+def test_parallel_robustness_sat():
+    """
+    Test that the parallel local robustness check agrees with the serial one
+    on an input the network is not robust around. (SAT)
+    """
+    input = np.array([1, -2])
+    valsSerial, _, maxClassSerial = evaluateRobustness(input, parallel=False)
+    valsParallel, _, maxClassParallel = evaluateRobustness(input, parallel=True)
+
+    # both modes should find an adversarial assignment
+    assert(len(valsSerial) > 0)
+    assert(len(valsParallel) > 0)
+
+    # for the same adversarial class
+    assert(maxClassSerial == maxClassParallel)
+
+def evaluateRobustness(input, parallel):
+    """
+    Load the test network and run evaluateLocalRobustness in the requested mode
+    """
+    filename = os.path.join(os.path.dirname(__file__), NNET_FILE)
+    network = Marabou.read_nnet(filename)
+    return network.evaluateLocalRobustness(input=input, epsilon=0.1, originalClass=0,
+                                           verbose=False, options=OPT, parallel=parallel)